@@ -2,9 +2,18 @@ import streamlit as st
 import sqlite3
 import pandas as pd
 import os
+import contextlib
+import queue
 import plotly.express as px
 from datetime import datetime
 
+# Optional: reads large result sets into Arrow buffers in C instead of
+# row-by-row Python tuples. Falls back to pd.read_sql when not installed.
+try:
+    import connectorx as cx
+except ImportError:
+    cx = None
+
 # --- CONFIGURATION ---
 st.set_page_config(
     page_title="Investment Analyzer - Admin DB", page_icon="🕵️", layout="wide"
@@ -46,13 +55,127 @@ if not DB_PATH:
     st.stop()
 
 
+def _tune_connection(c):
+    # mmap + a bigger page cache keep repeated aggregate queries in RAM
+    # instead of going through pread syscalls on every rerun.
+    c.execute("PRAGMA mmap_size=268435456")
+    c.execute("PRAGMA cache_size=-65536")
+    c.execute("PRAGMA temp_store=MEMORY")
+    c.execute("PRAGMA busy_timeout=2000")
+
+
 @st.cache_resource
 def get_connection():
-    return sqlite3.connect(DB_PATH, check_same_thread=False)
+    c = sqlite3.connect(DB_PATH, check_same_thread=False)
+    # WAL lets the dashboard keep reading while the Tauri app writes
+    c.execute("PRAGMA journal_mode=WAL")
+    c.execute("PRAGMA synchronous=NORMAL")
+    _tune_connection(c)
+    return c
+
+
+def _open_ro():
+    """Read-only handle (can never modify the DB)."""
+    ro = sqlite3.connect(f"file:{DB_PATH}?mode=ro", uri=True, check_same_thread=False)
+    ro.execute("PRAGMA query_only=1")
+    _tune_connection(ro)
+    return ro
+
+
+@st.cache_resource
+def get_ro_pool():
+    """Small pool of read-only handles so concurrent reruns don't serialize
+    on a single connection's mutex (WAL allows parallel readers)."""
+    pool = queue.Queue()
+    for _ in range(4):
+        pool.put(_open_ro())
+    return pool
+
+
+@contextlib.contextmanager
+def borrow():
+    pool = get_ro_pool()
+    c = pool.get()
+    try:
+        yield c
+    finally:
+        pool.put(c)
 
 
 conn = get_connection()
 
+
+# --- CACHED LOADERS ---
+# The indicators table is small and changes rarely; serve metadata from the
+# Streamlit cache so page clicks don't re-hit SQLite on every rerun.
+@st.cache_data(ttl=300)
+def load_catalog():
+    with borrow() as c:
+        return pd.read_sql(
+            """
+            SELECT
+                category as Category,
+                source as Source,
+                name as Name,
+                slug as Slug,
+                refresh_interval as 'Update Freq',
+                updated_at as 'Last Updated'
+            FROM indicators
+            ORDER BY category, name
+        """,
+            c,
+        )
+
+
+@st.cache_data(ttl=300)
+def load_indicators():
+    with borrow() as c:
+        return pd.read_sql("SELECT * FROM indicators ORDER BY source, slug", c)
+
+
+@st.cache_data(ttl=300)
+def load_indicators_meta():
+    with borrow() as c:
+        return pd.read_sql(
+            "SELECT slug, name, category, source FROM indicators ORDER BY category, name",
+            c,
+        )
+
+
+@st.cache_data(ttl=300)
+def load_cheat_sheet():
+    with borrow() as c:
+        return pd.read_sql(
+            "SELECT category, slug, name, source FROM indicators ORDER BY category, slug",
+            c,
+        )
+
+
+@st.cache_data(ttl=60)
+def load_history(slug, limit):
+    query = """
+        SELECT h.timestamp, h.value, h.metadata
+        FROM historical_data h
+        JOIN indicators i ON i.id = h.indicator_id
+        WHERE i.slug = ?
+        ORDER BY h.timestamp DESC
+        LIMIT ?
+    """
+    if cx is not None:
+        # connectorx has no parameter binding, but slug comes from our own
+        # selectbox and limit from the slider, both app-controlled values.
+        flat_query = query.replace("i.slug = ?", f"i.slug = '{slug}'").replace(
+            "LIMIT ?", f"LIMIT {int(limit)}"
+        )
+        df = cx.read_sql(f"sqlite://{os.path.abspath(DB_PATH)}", flat_query)
+        df["timestamp"] = pd.to_datetime(df["timestamp"])
+        return df
+
+    # parse_dates: timestamps come back as datetime64 in one C-side pass
+    with borrow() as c:
+        return pd.read_sql(query, c, params=(slug, limit), parse_dates=["timestamp"])
+
+
 # --- SIDEBAR ---
 st.sidebar.title("🕵️ Admin Dashboard")
 st.sidebar.caption(f"Connected to: `{DB_PATH}`")
@@ -69,12 +192,11 @@ if menu == "Overview":
 
     # 1. KPI Cards
     try:
-        total_indicators = pd.read_sql(
-            "SELECT COUNT(*) as count FROM indicators", conn
-        ).iloc[0]["count"]
-        total_rows = pd.read_sql(
-            "SELECT COUNT(*) as count FROM historical_data", conn
-        ).iloc[0]["count"]
+        with borrow() as c:
+            total_indicators = c.execute("SELECT COUNT(*) FROM indicators").fetchone()[
+                0
+            ]
+            total_rows = c.execute("SELECT COUNT(*) FROM historical_data").fetchone()[0]
         db_size = os.path.getsize(DB_PATH) / (1024 * 1024)  # MB
 
         c1, c2, c3 = st.columns(3)
@@ -88,20 +210,7 @@ if menu == "Overview":
         st.subheader("📚 Data Catalog")
 
         # Fetch all metadata
-        df_cat = pd.read_sql(
-            """
-            SELECT 
-                category as Category,
-                source as Source,
-                name as Name,
-                slug as Slug,
-                refresh_interval as 'Update Freq',
-                updated_at as 'Last Updated'
-            FROM indicators 
-            ORDER BY category, name
-        """,
-            conn,
-        )
+        df_cat = load_catalog()
 
         # Interactive Table
         st.dataframe(
@@ -118,7 +227,12 @@ if menu == "Overview":
 
         # 3. Category Distribution
         with st.expander("View Category Distribution"):
-            df_dist = df_cat.groupby("Category").size().reset_index(name="Count")
+            df_dist = (
+                df_cat["Category"]
+                .value_counts()
+                .rename_axis("Category")
+                .reset_index(name="Count")
+            )
             fig = px.pie(
                 df_dist,
                 names="Category",
@@ -137,7 +251,7 @@ elif menu == "API Sources":
     st.caption("Indicators grouped by data provider.")
 
     try:
-        df = pd.read_sql("SELECT * FROM indicators ORDER BY source, slug", conn)
+        df = load_indicators()
 
         # Get unique sources and sort them
         sources = sorted(df["source"].dropna().unique())
@@ -172,10 +286,7 @@ elif menu == "Data Inspector":
     st.title("🔍 Data Inspector")
 
     # 1. Filters (Hierarchical)
-    df_meta = pd.read_sql(
-        "SELECT slug, name, category, source FROM indicators ORDER BY category, name",
-        conn,
-    )
+    df_meta = load_indicators_meta()
 
     col1, col2 = st.columns(2)
 
@@ -206,17 +317,19 @@ elif menu == "Data Inspector":
         meta = df_meta[df_meta["slug"] == selected_slug].iloc[0]
         st.info(f"**{meta['name']}** ({meta['source']}) - `{meta['category']}`")
 
-        # 2. Load History
-        query = "SELECT * FROM historical_data WHERE indicator_id = (SELECT id FROM indicators WHERE slug = ?) ORDER BY timestamp DESC"
-        df_data = pd.read_sql(query, conn, params=(selected_slug,))
+        # 2. Load History (cached per slug, so revisiting an indicator is instant)
+        max_rows = st.slider(
+            "Max Rows (most recent first)", 500, 20000, 5000, step=500
+        )
+        df_data = load_history(selected_slug, max_rows)
 
         if df_data.empty:
             st.warning("⚠️ No data found for this indicator.")
         else:
             # Stats
             total_pts = len(df_data)
-            first_date = pd.to_datetime(df_data["timestamp"]).min()
-            last_date = pd.to_datetime(df_data["timestamp"]).max()
+            first_date = df_data["timestamp"].min()
+            last_date = df_data["timestamp"].max()
 
             c1, c2, c3, c4 = st.columns(4)
             c1.metric("Data Points", total_pts)
@@ -224,17 +337,18 @@ elif menu == "Data Inspector":
             c3.metric("End Date", last_date.strftime("%Y-%m-%d"))
 
             # Check Gaps (Simple check for > 7 days gap)
-            df_data["dt"] = pd.to_datetime(df_data["timestamp"])
-            df_data = df_data.sort_values("dt")
-            df_data["diff"] = df_data["dt"].diff()
-            max_gap = df_data["diff"].max()
+            df_data = df_data.sort_values("timestamp")
+            max_gap = df_data["timestamp"].diff().max()
             c4.metric(
                 "Max Gap", f"{max_gap.days} days" if pd.notnull(max_gap) else "N/A"
             )
 
-            # Chart (Top)
+            # Chart (Top) - thin long histories so plotly draws <= ~2000 points
             st.subheader("📈 Chart View")
-            fig = px.line(df_data, x="dt", y="value", title=f"{meta['name']} History")
+            df_plot = df_data.iloc[:: max(1, len(df_data) // 2000)]
+            fig = px.line(
+                df_plot, x="timestamp", y="value", title=f"{meta['name']} History"
+            )
             st.plotly_chart(fig, use_container_width=True)
 
             # Table (Bottom)
@@ -265,8 +379,12 @@ elif menu == "SQL Playground":
     if st.button("Run Query", type="primary"):
         try:
             if query.strip().upper().startswith("SELECT"):
-                df_result = pd.read_sql(query, conn)
-                st.success(f"Query returned {len(df_result)} rows.")
+                # Cap rows in SQLite itself so a stray SELECT * on
+                # historical_data can't blow up the Streamlit process.
+                wrapped = f"SELECT * FROM ({query.strip().rstrip(';')}) LIMIT 10000"
+                with borrow() as ro:
+                    df_result = pd.read_sql(wrapped, ro)
+                st.success(f"Query returned {len(df_result)} rows (capped at 10,000).")
                 st.dataframe(df_result, use_container_width=True)
             else:
                 cursor = conn.cursor()
@@ -283,10 +401,7 @@ elif menu == "Cheat Sheet":
     st.title("📋 Indicator Cheat Sheet")
     st.caption("Easy copy-paste list of all available indicators.")
 
-    df = pd.read_sql(
-        "SELECT category, slug, name, source FROM indicators ORDER BY category, slug",
-        conn,
-    )
+    df = load_cheat_sheet()
 
     # 1. Interactive Table
     st.subheader("Interactive Table (Click to Sort)")
@@ -300,13 +415,14 @@ elif menu == "Cheat Sheet":
     tab1, tab2, tab3 = st.tabs(["Markdown List", "CSV Format", "JSON Format"])
 
     with tab1:
-        md_text = ""
-        current_cat = ""
-        for _, row in df.iterrows():
-            if row["category"] != current_cat:
-                current_cat = row["category"]
-                md_text += f"\n### {current_cat}\n"
-            md_text += f"- **{row['name']}** (`{row['slug']}`)\n"
+        parts = []
+        for cat, sub in df.groupby("category", sort=False):
+            parts.append(f"\n### {cat}\n")
+            parts.extend(
+                f"- **{name}** (`{slug}`)\n"
+                for name, slug in zip(sub["name"], sub["slug"])
+            )
+        md_text = "".join(parts)
         st.code(md_text, language="markdown")
 
     with tab2:
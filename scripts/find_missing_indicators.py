@@ -2,33 +2,25 @@ import sqlite3
 import os
 
 
+APPDATA_CANDIDATES = [
+    ("APPDATA", "indicators.db"),
+    ("LOCALAPPDATA", "indicators.db"),
+    ("APPDATA", "data.db"),
+    ("LOCALAPPDATA", "data.db"),
+]
+LOCAL_CANDIDATES = ["src-tauri/data.db", "data.db", "investment_data.db"]
+
+
 def find_db_path():
-    possible_paths = [
-        os.path.join(
-            os.getenv("APPDATA"), "com.yun.investment-analyzer", "indicators.db"
-        )
-        if os.getenv("APPDATA")
-        else None,
-        os.path.join(
-            os.getenv("LOCALAPPDATA"), "com.yun.investment-analyzer", "indicators.db"
-        )
-        if os.getenv("LOCALAPPDATA")
-        else None,
-        os.path.join(os.getenv("APPDATA"), "com.yun.investment-analyzer", "data.db")
-        if os.getenv("APPDATA")
-        else None,
-        os.path.join(
-            os.getenv("LOCALAPPDATA"), "com.yun.investment-analyzer", "data.db"
-        )
-        if os.getenv("LOCALAPPDATA")
-        else None,
-        "src-tauri/data.db",
-        "data.db",
-        "investment_data.db",
-    ]
+    for env_var, filename in APPDATA_CANDIDATES:
+        base = os.getenv(env_var)
+        if base:
+            path = os.path.join(base, "com.yun.investment-analyzer", filename)
+            if os.path.exists(path):
+                return path
 
-    for path in possible_paths:
-        if path and os.path.exists(path):
+    for path in LOCAL_CANDIDATES:
+        if os.path.exists(path):
             return path
     return None
 
@@ -40,25 +32,25 @@ def find_missing_indicators():
         return
 
     print(f"✅ Found Database: {db_path}")
-    conn = sqlite3.connect(db_path)
+    # Read-only open: never takes a write lock against the running app
+    conn = sqlite3.connect(f"file:{db_path}?mode=ro", uri=True)
+    conn.execute("PRAGMA mmap_size=268435456")
+    conn.execute("PRAGMA cache_size=-65536")
+    conn.execute("PRAGMA busy_timeout=2000")
     cursor = conn.cursor()
 
     try:
-        # Get all indicators and their data counts
+        # Only indicators with zero data points cross the connection
         cursor.execute("""
-            SELECT i.slug, i.source, COUNT(h.indicator_id) as count
+            SELECT i.slug, i.source
             FROM indicators i
             LEFT JOIN historical_data h ON i.id = h.indicator_id
             GROUP BY i.slug
-            ORDER BY count ASC
+            HAVING COUNT(h.indicator_id) = 0
+            ORDER BY i.slug
         """)
 
-        results = cursor.fetchall()
-
-        missing_indicators = []
-        for slug, source, count in results:
-            if count == 0:
-                missing_indicators.append((slug, source))
+        missing_indicators = cursor.fetchall()
 
         if not missing_indicators:
             print("✅ All indicators have data!")
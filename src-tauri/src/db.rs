@@ -16,7 +16,11 @@ pub async fn init(data_dir: &Path) -> Result<SqlitePool> {
         
     println!("Running migrations...");
     sqlx::migrate!("./migrations").run(&pool).await?;
-    
+
+    // Refresh query-planner statistics so history lookups keep using the
+    // composite PK index (indicator_id, timestamp) instead of re-sorting.
+    sqlx::query("PRAGMA optimize").execute(&pool).await?;
+
     println!("Database initialized successfully.");
     Ok(pool)
 }
@@ -1,4 +1,5 @@
 use anyhow::Result;
+use once_cell::sync::Lazy;
 use reqwest::Client;
 use crate::models::DataPoint;
 use scraper::{Html, Selector};
@@ -12,6 +13,18 @@ use std::path::Path;
 const FNG_URL: &str = "https://feargreedmeter.com/";
 const CSV_PATH: &str = "../docs/fng_recent.csv";
 
+// Compiled once at first use (Lazy, same pattern as indicators/registry.rs)
+static NEXT_DATA_SELECTOR: Lazy<Selector> =
+    Lazy::new(|| Selector::parse("#__NEXT_DATA__").unwrap());
+
+// Shared client so keep-alive connections survive across scheduler runs
+static HTTP_CLIENT: Lazy<Client> = Lazy::new(|| {
+    Client::builder()
+        .user_agent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
+        .build()
+        .unwrap_or_else(|_| Client::new())
+});
+
 #[derive(Deserialize, Debug)]
 struct NextData {
     props: PageProps,
@@ -56,11 +69,7 @@ pub async fn fetch_fear_and_greed() -> Result<Vec<DataPoint>> {
 async fn try_update_fng_data() -> Result<()> {
     println!("CNN Fetcher: Scraping live data from {}", FNG_URL);
 
-    let client = Client::builder()
-        .user_agent("Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36")
-        .build()?;
-
-    let resp = client.get(FNG_URL).send().await?;
+    let resp = HTTP_CLIENT.get(FNG_URL).send().await?;
     if !resp.status().is_success() {
         return Err(anyhow::anyhow!("HTTP Error: {}", resp.status()));
     }
@@ -69,8 +78,7 @@ async fn try_update_fng_data() -> Result<()> {
     let document = Html::parse_document(&html_content);
     
     // Extract __NEXT_DATA__ script
-    let selector = Selector::parse("#__NEXT_DATA__").unwrap();
-    let script_element = document.select(&selector).next()
+    let script_element = document.select(&NEXT_DATA_SELECTOR).next()
         .ok_or_else(|| anyhow::anyhow!("Could not find #__NEXT_DATA__ script"))?;
     
     let json_text = script_element.inner_html();
@@ -5,7 +5,8 @@ use anyhow::{Result, anyhow};
 use reqwest::Client;
 use serde::Deserialize;
 use chrono::{TimeZone, Utc};
-use reqwest::header::{HeaderMap, HeaderValue, USER_AGENT, AUTHORIZATION};
+use once_cell::sync::Lazy;
+use reqwest::header::{HeaderMap, HeaderValue, USER_AGENT};
 
 /// Tiingo API response structure for daily prices
 #[derive(Debug, Deserialize)]
@@ -18,6 +19,19 @@ struct TiingoPriceData {
 
 use sqlx::SqlitePool;
 
+// Shared client: a new TiingoFetcher is built per symbol in the orchestrator,
+// so the connection pool must live outside the struct for keep-alive to help.
+// Auth travels in the token query param, so the client itself is key-agnostic.
+static HTTP_CLIENT: Lazy<Client> = Lazy::new(|| {
+    let mut headers = HeaderMap::new();
+    headers.insert(USER_AGENT, HeaderValue::from_static("InvestmentAnalyzer/1.0"));
+
+    Client::builder()
+        .default_headers(headers)
+        .build()
+        .unwrap_or_else(|_| Client::new())
+});
+
 pub struct TiingoFetcher {
     api_key: String,
     client: Client,
@@ -27,20 +41,7 @@ pub struct TiingoFetcher {
 
 impl TiingoFetcher {
     pub fn new(api_key: String, backfill: bool, pool: Option<SqlitePool>) -> Self {
-        let mut headers = HeaderMap::new();
-        headers.insert(USER_AGENT, HeaderValue::from_static("InvestmentAnalyzer/1.0"));
-        
-        // Tiingo uses Authorization header with Token prefix
-        if let Ok(auth_value) = HeaderValue::from_str(&format!("Token {}", api_key)) {
-            headers.insert(AUTHORIZATION, auth_value);
-        }
-        
-        let client = Client::builder()
-            .default_headers(headers)
-            .build()
-            .unwrap_or_else(|_| Client::new());
-
-        Self { api_key, client, backfill, pool }
+        Self { api_key, client: HTTP_CLIENT.clone(), backfill, pool }
     }
 }
 